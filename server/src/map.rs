@@ -67,9 +67,11 @@ pub fn init(ctx: &ReducerContext) {
 
     for file in MAPS_DIR.files() {
         let filename = file.path().file_name().unwrap().to_str().unwrap();
-        if !filename.ends_with(".csv") { continue; }
+        // Ignora arquivos ocultos (ex: ".DS_Store.csv") e qualquer coisa que não seja CSV
+        if filename.starts_with('.') { continue; }
+        let Some(stem) = filename.strip_suffix(".csv") else { continue; };
 
-        let template_name = filename.replace(".csv", "").replace("..", "").trim().to_lowercase();
+        let template_name = stem.replace("..", "").trim().to_lowercase();
 
         let content = file.contents_utf8().expect("Erro Crítico: UTF-8 inválido");
         let lines: Vec<&str> = content.lines().map(|l| l.trim()).filter(|l| !l.is_empty()).collect();
@@ -82,15 +84,15 @@ pub fn init(ctx: &ReducerContext) {
         let height = lines.len() as u32;
         let width = lines[0].split(',').map(|s| s.trim()).filter(|s| !s.is_empty()).count() as u32;
 
-        let mut tile_data = Vec::new();
+        let mut tile_data = Vec::with_capacity((width * height) as usize);
         let mut spawn_x = 0.0;
         let mut spawn_y = 0.0;
         let mut found_spawn = false;
 
         for (y, line) in lines.iter().enumerate() {
-            let cols: Vec<&str> = line.split(',').map(|s| s.trim()).filter(|s| !s.is_empty()).collect();
+            let cols = line.split(',').map(|s| s.trim()).filter(|s| !s.is_empty());
 
-            for (x, val_str) in cols.iter().enumerate() {
+            for (x, val_str) in cols.enumerate() {
                 if let Ok(tile_id) = u32::from_str(val_str) {
                     // --- DETECTOR DE SPAWN (Tile 1) ---
                     if tile_id == SPAWN_TILE {